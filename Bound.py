@@ -13,6 +13,8 @@ PART_OF_RIGHT = False
 
 class Bound:
 	
+	__slots__ = ('__value', '__part_of_left')
+	
 	def __init__(self, value: float, part_of_left: bool):
 		"""
 		:param value: The floating point value of the bound.
@@ -37,6 +39,11 @@ class Bound:
 		elif self.__value == float("inf") and self.part_of_right:
 			raise Exception("Bounds at inf must be included_in_left")
 	
+	def _init_from_valid_bound(self, bound: Bound):
+		"""Used in place of __init__ by subclasses which wrap an existing bound. The bound was validated when it was constructed, so validation is skipped."""
+		self.__value = bound.__value
+		self.__part_of_left = bound.__part_of_left
+	
 	def __hash__(self):
 		return hash((self.__value, self.__part_of_left))
 	
@@ -106,13 +113,15 @@ iBound_Positive_Infinity = Bound(float('inf'), PART_OF_LEFT)
 
 
 class Linked_Bound(Bound):
+	__slots__ = ('__interval', '__is_lower_bound')
+	
 	def __init__(self, bound: Bound, interval: Interval, is_lower_bound: bool):
 		"""
 		This class allows intervals to be decomposed into bounds without forgetting where the bound came from and if it was and an upper or lower bound.
 		it should not be instantiated directly, but obtained through an instance of iInterval by calling:
 		>>>Interval(...).get_linked_bounds()
 		"""
-		super().__init__(bound.value, bound.part_of_left)
+		self._init_from_valid_bound(bound)
 		self.__interval: Union[Interval] = interval
 		self.__is_lower_bound = is_lower_bound
 	
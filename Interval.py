@@ -28,6 +28,9 @@ T = TypeVar("T")
 class Interval:
 	"""Immutable Interval based on python's built in floats. Nothing fancy."""
 	
+	# __slots__ avoids a per-instance __dict__; large numbers of intervals are created by most operations
+	__slots__ = ('__lower_bound', '__upper_bound', '__length', '__is_complete', '_linked_objects')
+	
 	@classmethod
 	def complete(cls):
 		"""returns an interval spanning the complete real number line. Or at least all representable python floats."""
@@ -90,8 +93,11 @@ class Interval:
 		return ops.coerce_collection_to_Interval_or_Multi_Interval(collection)
 	
 	def __init__(self, lower_bound: Bound, upper_bound: Bound):
-		if not (isinstance(lower_bound, Bound) and isinstance(upper_bound, Bound)):
-			raise TypeError("Bounds must be an instance of iBound")
+		# Every operation constructs its result intervals through here. The type check is skipped when python is run with -O;
+		#  a wrong argument type will then fail with an AttributeError on the first bound access below instead.
+		if __debug__:
+			if not (isinstance(lower_bound, Bound) and isinstance(upper_bound, Bound)):
+				raise TypeError("Bounds must be an instance of iBound")
 		
 		self.__lower_bound: Bound = lower_bound
 		self.__upper_bound: Bound = upper_bound
@@ -107,6 +113,18 @@ class Interval:
 		elif lower_bound.value > upper_bound.value:
 			raise Exception(f"reversed intervals are not permitted. lower_bound.value must be less than or equal to upper_bound.value: {lower_bound} <= {upper_bound} == {lower_bound.value<=upper_bound.value}")
 		
+		# the bounds never change, so these are computed once here rather than on every call to the properties below
+		self.__length: float = upper_bound.value - lower_bound.value
+		self.__is_complete: bool = lower_bound.value == float('-inf') and upper_bound.value == float('inf')
+	
+	def _init_from_valid_bounds(self, lower_bound: Bound, upper_bound: Bound):
+		"""Used in place of __init__ by subclasses which wrap the bounds of an existing interval. The bounds were validated when that interval was constructed, so validation is skipped."""
+		self.__lower_bound = lower_bound
+		self.__upper_bound = upper_bound
+		self._linked_objects = tuple()
+		self.__length = upper_bound.value - lower_bound.value
+		self.__is_complete = lower_bound.value == float('-inf') and upper_bound.value == float('inf')
+	
 	def __format__(self, format_spec):
 		char_left = f"{format(float(self.__lower_bound.value), format_spec)}"
 		char_right = f"{format(float(self.__upper_bound.value), format_spec)}"
@@ -195,14 +213,14 @@ class Interval:
 	
 	@property
 	def is_complete(self) -> bool:
-		return ops.is_complete(self)
+		return self.__is_complete
 	
 	@ property
 	def length(self) -> float:
-		return self.__upper_bound.value - self.__lower_bound.value
+		return self.__length
 	
 	def interpolate(self, ratio: float) -> float:
-		return self.__lower_bound.value + (self.__upper_bound.value - self.__lower_bound.value) * ratio
+		return self.__lower_bound.value + self.__length * ratio
 	
 	def contains_value(self, value: float) -> bool:
 		return ops.contains_value(self, value)
@@ -221,23 +239,23 @@ class Interval:
 	
 	@property
 	def exterior(self) -> Collection[Interval]:
-		return ops.coerce_collection_to_Interval_or_Multi_Interval(ops.exterior(self))
+		return ops.exterior(self)
 	
 	@property
 	def interior(self) -> Collection[Interval]:
-		return ops.coerce_collection_to_Interval_or_Multi_Interval(ops.interior(self))
+		return ops.coerce_new_list_to_Interval_or_Multi_Interval(ops.interior(self))
 	
 	def intersect(self, other: Collection[Interval]):
-		return ops.coerce_collection_to_Interval_or_Multi_Interval(ops.intersect(self, other))
+		return ops.coerce_new_list_to_Interval_or_Multi_Interval(ops.intersect(self, other))
 	
 	def subtract(self, other: Collection[Interval]) -> Multi_Interval:
-		return ops.coerce_collection_to_Interval_or_Multi_Interval(ops.subtract(self, other))
+		return ops.coerce_new_list_to_Interval_or_Multi_Interval(ops.subtract(self, other))
 	
 	def hull(self, other: Iterable[Interval] = tuple()):
 		return ops.coerce_collection_to_Interval_or_Multi_Interval(ops.hull(itertools.chain(self, other)))
 	
 	def union(self, other: Iterable[Interval]) -> Collection[Interval]:
-		return ops.coerce_collection_to_Interval_or_Multi_Interval([*itertools.chain(self, other)])
+		return ops.coerce_new_list_to_Interval_or_Multi_Interval([*self, *other])
 	
 	def scaled(self, scale_factor: float):
 		return ops.coerce_collection_to_Interval_or_Multi_Interval(ops.scaled(self, scale_factor))
@@ -259,7 +277,7 @@ class Interval:
 	#  union may imply a flattening of self and other intervals, just the other intervals, just the self or neither.
 	#  the default will be neither. But t avoid confusion, union will be named 'union_keeping_overlaps'
 	def union_keeping_overlaps(self, other: Iterable[Interval]):
-		return ops.coerce_collection_to_Interval_or_Multi_Interval([*self, *other])
+		return ops.coerce_new_list_to_Interval_or_Multi_Interval([*self, *other])
 	
 	def union_merge_intersecting(self, other: Iterable[Interval]):
 		return ops.coerce_collection_to_Interval_or_Multi_Interval(ops.union_merge_intersecting(self, other))
@@ -300,6 +318,8 @@ class Interval:
 #  then changing all _operators to merge or split the content of the linked_objects array
 #  then we can dispense with the linked objects array
 class Linked_Interval(Interval, Generic[T]):
+	__slots__ = ()
+	
 	def __init__(self, original_iInterval: Interval, linked_objects: Iterable[T]):
-		super().__init__(original_iInterval.lower_bound, original_iInterval.upper_bound)
+		self._init_from_valid_bounds(original_iInterval.lower_bound, original_iInterval.upper_bound)
 		self._linked_objects = tuple(linked_objects)
\ No newline at end of file
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-import itertools
+from collections import deque
 from typing import Tuple, Collection, Iterable, Callable, Sequence
 
 from NicksIntervals import util
@@ -69,25 +69,26 @@ class Interval_Multi_Map:
 	
 	def merge_on_predicates(self, from_predicate: Callable[[Interval, Interval], bool], to_predicate: Callable[[Interval, Interval], bool]):
 		"""Merge links based on the provided predicates; the Interval_Map class provide some helpers as @classmethods.
-		All combinations are tested, and the process starts again each time a merge is performed."""
-		# TODO: this is a very slow algorithm O(n^2) or O(n!) ? not good stuff. We can improve by creating an 'add and merge'
+		Each link is tested against the links merged so far. When a merge is performed, the merged link is tested again
+		since its hull may now satisfy the predicates against other links."""
 		# TODO: this algorithm has issues when one interval_map completely contains the other.
 		#  Might be better to progressively build the map using .add_merge_if_contained_or_touching()
 		
-		result = [*self.__links]
-		must_restart = True
-		while must_restart:
-			must_restart = False
-			for a, b in itertools.combinations(result, 2):
-				if from_predicate(a[0], b[0]) and to_predicate(a[1], b[1]):
-					result.remove(a)
-					result.remove(b)
-					result.append((
-						ops.hull_atomic(a[0], b[0]),
-						ops.hull_atomic(a[1], b[1])
+		# links in result never satisfy the predicates against each other
+		result = []
+		links_to_insert = deque(self.__links)
+		while links_to_insert:
+			link_to_insert = links_to_insert.popleft()
+			for index, existing_link in enumerate(result):
+				if from_predicate(existing_link[0], link_to_insert[0]) and to_predicate(existing_link[1], link_to_insert[1]):
+					del result[index]
+					links_to_insert.appendleft((
+						ops.hull_atomic(existing_link[0], link_to_insert[0]),
+						ops.hull_atomic(existing_link[1], link_to_insert[1])
 					))
-					must_restart = True
 					break
+			else:
+				result.append(link_to_insert)
 		return Interval_Multi_Map(result)
 	
 	def add_merge_if_contained_or_touching(self, interval_map_to_add: Interval_Map) -> Interval_Multi_Map:
@@ -99,25 +100,26 @@ class Interval_Multi_Map:
 		"""
 		
 		interval_map_to_add = [interval_map_to_add]
-
-		result = list(self.__links)
 		
-		must_restart = True
+		result = []
+		links_to_check = deque(self.__links)
+		
+		while links_to_check:
+			sub_result = links_to_check.popleft()
+			if sub_result.contains(interval_map_to_add[0]):
+				interval_map_to_add = []
+				result.append(sub_result)
+				result.extend(links_to_check)
+				break
+			elif interval_map_to_add[0].contains(sub_result):
+				# sub_result is dropped from the result
+				pass
+			elif sub_result.touches(interval_map_to_add[0]):
+				interval_map_to_add = [interval_map_to_add[0].merge_by_hull(sub_result)]
+				# the merged element is larger; links that were already kept must be checked against it again.
+				links_to_check.extend(result)
+				result = []
+			else:
+				result.append(sub_result)
 		
-		while must_restart:
-			must_restart = False
-			for sub_result in result:
-				if sub_result.contains(interval_map_to_add[0]):
-					interval_map_to_add = []
-					break
-				elif interval_map_to_add[0].contains(sub_result):
-					result.remove(sub_result)
-					must_restart = True
-					break
-				elif sub_result.touches(interval_map_to_add[0]):
-					interval_map_to_add = [interval_map_to_add[0].merge_by_hull(sub_result)]
-					result.remove(sub_result)
-					must_restart = True
-					break
-					
 		return Interval_Multi_Map([*result, *interval_map_to_add])
\ No newline at end of file
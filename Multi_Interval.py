@@ -1,7 +1,6 @@
 from __future__ import annotations
 
-import itertools
-from typing import Iterable, Collection, TYPE_CHECKING, Optional
+from typing import Iterable, Collection, TYPE_CHECKING, Optional, List
 
 import NicksIntervals.Interval
 # if TYPE_CHECKING:
@@ -10,8 +9,19 @@ import NicksIntervals.Bound
 
 class Multi_Interval(NicksIntervals.Interval.Interval):
 	
+	__slots__ = ('__intervals', '__sorted_index')
+	
 	def __init__(self, iter_intervals: Iterable[NicksIntervals.Interval.Interval]):
 		self.__intervals: Collection[NicksIntervals.Interval.Interval] = tuple(iter_intervals)
+		self.__sorted_index = None
+	
+	@classmethod
+	def _from_trusted_list(cls, intervals: List[NicksIntervals.Interval.Interval]) -> Multi_Interval:
+		"""wraps a freshly built list of intervals without copying it; the caller must not keep or mutate the list afterwards"""
+		result = cls.__new__(cls)
+		result.__intervals = intervals
+		result.__sorted_index = None
+		return result
 	
 	def __format__(self, format_spec):
 		return f"Multi_Interval[{len(self.__intervals)}]([{', '.join(['...' + str(len(self.__intervals)) if index == 4 else format(interval, format_spec) for index, interval in enumerate(self.__intervals) if index < 5])}])"
@@ -38,18 +48,23 @@ class Multi_Interval(NicksIntervals.Interval.Interval):
 	@property
 	def upper_bound(self) -> Optional[NicksIntervals.Bound.Bound]:
 		# raise Exception("Should not be called internally")
-		if len(self.__intervals) > 0:
-			return max(bound.bound for bound in itertools.chain.from_iterable(interval.get_linked_bounds() for interval in self.__intervals))
-		else:
-			return None
+		# no lower bound can be greater than the upper bound of its own interval, so only the upper bounds need comparing
+		return max((interval.upper_bound for interval in self.__intervals), default=None)
 	
 	@property
 	def lower_bound(self) -> Optional[NicksIntervals.Bound.Bound]:
 		# raise Exception("Should not be called internally")
-		if len(self.__intervals) > 0:
-			return min(bound.bound for bound in itertools.chain.from_iterable(interval.get_linked_bounds() for interval in self.__intervals))
-		else:
-			return None
+		return min((interval.lower_bound for interval in self.__intervals), default=None)
 		
+	@property
+	def is_complete(self) -> bool:
+		return NicksIntervals.Interval.ops.is_complete(self)
+	
+	def contains_value(self, value: float) -> bool:
+		# sub-intervals are immutable, so the index is built on first use and never invalidated
+		if self.__sorted_index is None:
+			self.__sorted_index = NicksIntervals.Interval.ops.get_sorted_index(self.__intervals)
+		return NicksIntervals.Interval.ops.contains_value_using_sorted_index(self.__sorted_index, value)
+	
 	def interior_merged(self):
 		return NicksIntervals.Interval.ops.coerce_collection_to_Interval_or_Multi_Interval(NicksIntervals.Interval.ops.interior_merged(self))
@@ -1,8 +1,10 @@
 from __future__ import annotations
 
+import bisect
 import itertools
 import math
-from typing import TypeVar, Generator, Tuple, TYPE_CHECKING, List, Sized, Collection, Union, Iterable, Iterator, Callable, Sequence, Optional
+from collections import deque
+from typing import TypeVar, Generator, Tuple, TYPE_CHECKING, Dict, List, Sized, Collection, Union, Iterable, Iterator, Callable, Sequence, Optional
 
 from NicksIntervals import util
 from NicksIntervals.Bound import Bound, iBound_Negative_Infinity, iBound_Positive_Infinity, Linked_Bound
@@ -117,7 +119,7 @@ def get_linked_intervals(a: Iterable[Interval], linked_objects: Iterable[T]) ->
 
 
 def is_complete(a: Collection[Interval]) -> bool:
-	bounds = sorted(get_bounds(a))
+	bounds = sort_bounds(get_bounds(a))
 	if len(bounds) < 2:
 		return False
 	return bounds[0] == iBound_Negative_Infinity and bounds[-1] == iBound_Positive_Infinity
@@ -130,13 +132,18 @@ def is_empty(a: Sized[Interval]):
 def subtract_based_on_atomics(a: Iterable[Interval], b: Iterable[Interval]) -> Collection[Interval]:
 	# The performance of this algorithm on any multi_interval with many sub intervals is abysmal.
 	#  must be reimplemented as a line-sweep for decent performance. This stays here for testing purposes.
-	result = a
+	result = list(a)
+	# the two lists are swapped after each interval_b rather than allocating a new list every time
+	interim_result = []
 	
 	for interval_b in b:
-		# List constructor is called here to cause immediate evaluation of the generator.
-		# Otherwise the reassignment to 'result' may trigger weird issues with closures on the next iteration of the for loop
-		# This makes the execution eager, but we cant have our entire software consist of a giant lazy nested generator like in haskell I suppose.
-		result = list(itertools.chain.from_iterable(subtract_atomic(interval_a, interval_b) for interval_a in result))
+		if not result:
+			# nothing is left to subtract from
+			break
+		for interval_a in result:
+			interim_result.extend(subtract_atomic(interval_a, interval_b))
+		result, interim_result = interim_result, result
+		interim_result.clear()
 	
 	return result
 
@@ -149,7 +156,7 @@ def subtract_and_flatten(minuend: Iterable[Interval], subtrahend: Iterable[Inter
 	
 	bound_list = []
 	
-	sorted_link_bounds = sorted(itertools.chain(get_linked_bounds(get_linked_intervals(minuend, minuend)), get_linked_bounds(get_linked_intervals(subtrahend, subtrahend))))
+	sorted_link_bounds = sort_bounds(itertools.chain(get_linked_bounds(get_linked_intervals(minuend, minuend)), get_linked_bounds(get_linked_intervals(subtrahend, subtrahend))))
 	
 	minuend_stack_count_before = 0
 	minuend_stack_count_after = 0
@@ -188,10 +195,12 @@ def subtract(minuend: Iterable[Interval], subtrahend: Iterable[Interval]) -> Col
 	#  the only significant place it is used is here... and a few other places that don't matter as much.
 	#  linked bounds will still be needed due to thier sorting behaviour, unless we make a function that does
 	#  that on something like a List[Tuple[bound:iBound, is_lower:bool, interval:Interval]]
-	sorted_link_bounds = sorted(itertools.chain(get_linked_bounds(get_linked_intervals(minuend, [minuend])), get_linked_bounds(get_linked_intervals(subtrahend, [subtrahend]))))
+	sorted_link_bounds = sort_bounds(itertools.chain(get_linked_bounds(get_linked_intervals(minuend, [minuend])), get_linked_bounds(get_linked_intervals(subtrahend, [subtrahend]))))
 	
-	minuend_intervals_awaiting_lower_bound: List[Interval] = []
-	minuend_intervals_awaiting_upper_bound: List[Tuple[Interval, Linked_Bound]] = []
+	# minuend intervals are keyed by id() because interval equality does not distinguish duplicate sub-intervals.
+	#  this way each pool lookup below is O(1) instead of a linear scan using __eq__
+	minuend_intervals_awaiting_lower_bound: Dict[int, Interval] = {}
+	minuend_intervals_awaiting_upper_bound: Dict[int, Tuple[Interval, Linked_Bound]] = {}
 	
 	subtrahend_stack_count_previous = 0
 	subtrahend_stack_count = 0
@@ -206,32 +215,29 @@ def subtract(minuend: Iterable[Interval], subtrahend: Iterable[Interval]) -> Col
 		elif current_bound.interval.linked_objects[0] is minuend:
 			if current_bound.is_lower_bound:
 				if subtrahend_stack_count > 0:
-					minuend_intervals_awaiting_lower_bound.append(current_bound.interval)
+					minuend_intervals_awaiting_lower_bound[id(current_bound.interval)] = current_bound.interval
 				else:
-					minuend_intervals_awaiting_upper_bound.append((current_bound.interval, current_bound))
+					minuend_intervals_awaiting_upper_bound[id(current_bound.interval)] = (current_bound.interval, current_bound)
 			else:  # current_bound.is_upper_bound
-				try:
-					# this interval was entirely overlapped by the subtrahend, and never found a starting bound. no further action required as it is not to be in the output
-					minuend_intervals_awaiting_lower_bound.remove(current_bound.interval)
-				except:
+				if minuend_intervals_awaiting_lower_bound.pop(id(current_bound.interval), None) is None:
 					# this interval did find a lower bound, it must be added to the output.
-					interval_to_close = next(item for item in minuend_intervals_awaiting_upper_bound if item[0] == current_bound.interval)
-					minuend_intervals_awaiting_upper_bound.remove(interval_to_close)
+					# otherwise it was entirely overlapped by the subtrahend, and never found a starting bound. no further action required as it is not to be in the output
+					interval_to_close = minuend_intervals_awaiting_upper_bound.pop(id(current_bound.interval))
 					if interval_to_close[1].bound != current_bound.bound:  # TODO: is this if statement necessary?
 						result.append(Interval(interval_to_close[1].bound, current_bound.bound))
 		
 		if subtrahend_stack_count > 0 and subtrahend_stack_count_previous == 0:  # a lower bound of subtrahend
 			# the current bound should be used to terminate all intervals in awaiting_upper_bound, and all these intervals should be moved into awaiting lower bound.
-			for awaiting_upper_bound in minuend_intervals_awaiting_upper_bound:
-				minuend_intervals_awaiting_lower_bound.append(awaiting_upper_bound[0])
+			for key, awaiting_upper_bound in minuend_intervals_awaiting_upper_bound.items():
+				minuend_intervals_awaiting_lower_bound[key] = awaiting_upper_bound[0]
 				if awaiting_upper_bound[1].bound != current_bound.bound:
 					result.append(Interval(awaiting_upper_bound[1].bound, current_bound.bound))
-			minuend_intervals_awaiting_upper_bound = []
+			minuend_intervals_awaiting_upper_bound = {}
 		elif subtrahend_stack_count == 0 and subtrahend_stack_count_previous > 0:  # an upper bound of subtrahend
 			# the current bound should be used to start all intervals in awaiting lower bound, and they should be moved into awaiting upper bound
-			for awaiting_lower_bound in minuend_intervals_awaiting_lower_bound:
-				minuend_intervals_awaiting_upper_bound.append((awaiting_lower_bound, current_bound))
-			minuend_intervals_awaiting_lower_bound = []
+			for key, awaiting_lower_bound in minuend_intervals_awaiting_lower_bound.items():
+				minuend_intervals_awaiting_upper_bound[key] = (awaiting_lower_bound, current_bound)
+			minuend_intervals_awaiting_lower_bound = {}
 		
 		subtrahend_stack_count_previous = subtrahend_stack_count
 		
@@ -240,8 +246,9 @@ def subtract(minuend: Iterable[Interval], subtrahend: Iterable[Interval]) -> Col
 
 def subtract_atomic(a: Interval, b: Interval) -> Collection[Interval]:
 	from .Interval import Interval
-	other_contains_self_lower_bound = contains_lower_bound_atomic(b, a.lower_bound)
-	other_contains_self_upper_bound = contains_upper_bound_atomic(b, a.upper_bound)
+	a_lower_bound, a_upper_bound, b_lower_bound, b_upper_bound = a.lower_bound, a.upper_bound, b.lower_bound, b.upper_bound
+	other_contains_self_lower_bound = contains_lower_bound_atomic(b, a_lower_bound)
+	other_contains_self_upper_bound = contains_upper_bound_atomic(b, a_upper_bound)
 	
 	#   self:        ╠════╣
 	#  other:  ╠════════════╣
@@ -249,26 +256,26 @@ def subtract_atomic(a: Interval, b: Interval) -> Collection[Interval]:
 	if other_contains_self_lower_bound and other_contains_self_upper_bound:
 		return tuple()
 	
-	self_contains_other_lower_bound = contains_lower_bound_atomic(a, b.lower_bound)
-	self_contains_other_upper_bound = contains_upper_bound_atomic(a, b.upper_bound)
+	self_contains_other_lower_bound = contains_lower_bound_atomic(a, b_lower_bound)
+	self_contains_other_upper_bound = contains_upper_bound_atomic(a, b_upper_bound)
 	
 	#   self:  ╠════════════╣
 	#  other:        ╠════╣
 	# result:  ╠═════╡    ╞═╣
 	if self_contains_other_lower_bound and self_contains_other_upper_bound:
 		interim_result = []
-		if a.lower_bound != b.lower_bound:
-			interim_result.append(Interval(a.lower_bound, b.lower_bound))
-		if b.upper_bound != a.upper_bound:
-			interim_result.append(Interval(b.upper_bound, a.upper_bound))
+		if a_lower_bound != b_lower_bound:
+			interim_result.append(Interval(a_lower_bound, b_lower_bound))
+		if b_upper_bound != a_upper_bound:
+			interim_result.append(Interval(b_upper_bound, a_upper_bound))
 		return tuple(interim_result)
 	
 	#   self:        ╠══════════╣
 	#  other:  ╠════════════╣
 	# result:               ╞═══╣
 	if other_contains_self_lower_bound:
-		if b.upper_bound != a.upper_bound:
-			return tuple(Interval(b.upper_bound, a.upper_bound))
+		if b_upper_bound != a_upper_bound:
+			return tuple(Interval(b_upper_bound, a_upper_bound))
 	
 	#   self:        ╠════╣
 	#  other:  ╠════════════╣
@@ -281,8 +288,8 @@ def subtract_atomic(a: Interval, b: Interval) -> Collection[Interval]:
 	#  other:        ╠════════════╣
 	# result:    ╠═══╡
 	if other_contains_self_upper_bound:
-		if a.lower_bound != b.lower_bound:
-			return tuple(Interval(a.lower_bound, b.lower_bound))
+		if a_lower_bound != b_lower_bound:
+			return tuple(Interval(a_lower_bound, b_lower_bound))
 	
 	# if execution makes it past all above continues, the only remaining possibility is that the intervals are disjoint
 	# in this case the entire first interval is output
@@ -291,6 +298,10 @@ def subtract_atomic(a: Interval, b: Interval) -> Collection[Interval]:
 
 
 def intersect(a: Collection[Interval], b: Collection[Interval]) -> Collection[Interval]:
+	if len(b) == 1:
+		# each sub-interval of a can be clipped to a single interval without sorting and sweeping the bounds of a
+		b_interval, = b
+		return list(itertools.chain.from_iterable(intersect_atomic(a_interval, b_interval) for a_interval in a if intersects_atomic(a_interval, b_interval)))
 	# TODO: This will have abysmal performance on large datasets
 	#  I think it can be implemented as a sweep over linked bounds?
 	return subtract(a, exterior(b))
@@ -298,38 +309,37 @@ def intersect(a: Collection[Interval], b: Collection[Interval]) -> Collection[In
 
 def intersect_atomic(a: Interval, b: Interval) -> Collection[Interval]:
 	from .Interval import Interval
-	self_contains_other_lower_bound = contains_lower_bound_atomic(a, b.lower_bound)
-	self_contains_other_upper_bound = contains_upper_bound_atomic(a, b.upper_bound)
-	
-	#   self:  ╠════════════╣
-	#  other:        ╠════╣
-	# result:        ╠════╣
-	if self_contains_other_lower_bound and self_contains_other_upper_bound:
-		return b
-	
-	other_contains_self_lower_bound = contains_lower_bound_atomic(b, a.lower_bound)
-	
-	#   self:        ╠══════════╣
-	#  other:  ╠════════════╣
-	# result:        ╠══════╣
-	if other_contains_self_lower_bound:
-		return Interval(a.lower_bound, b.upper_bound)
-	
-	other_contains_self_upper_bound = contains_upper_bound_atomic(b, a.upper_bound)
-	
-	#   self:        ╠════╣
-	#  other:  ╠════════════╣
-	# result:        ╠════╣
-	if other_contains_self_lower_bound and other_contains_self_upper_bound:
-		return a
+	lower_bound, upper_bound, is_intersecting = intersect_bounds_atomic(a, b)
+	if is_intersecting:
+		return Interval(lower_bound, upper_bound)
+	return tuple()
+
+
+def intersect_bounds_atomic(a: Interval, b: Interval) -> Tuple[Bound, Bound, bool]:
+	"""
+	Clamps the bounds of a to the bounds of b. returns a tuple;
+	(
+		lower_bound: Bound,
+		upper_bound: Bound,
+		is_intersecting: bool  # False if the bounds do not form an interval because a and b are disjoint
+	)
+	"""
+	a_lower_bound, a_upper_bound, b_lower_bound, b_upper_bound = a.lower_bound, a.upper_bound, b.lower_bound, b.upper_bound
+	a_lower_value, a_upper_value, b_lower_value, b_upper_value = a_lower_bound.value, a_upper_bound.value, b_lower_bound.value, b_upper_bound.value
 	
-	#   self:    ╠══════════╣
-	#  other:        ╠════════════╣
-	# result:        ╠══════╣
-	if other_contains_self_upper_bound:
-		return Interval(b.lower_bound, a.upper_bound)
+	# equivalent to max(a_lower_bound, b_lower_bound) and min(a_upper_bound, b_upper_bound)
+	#  without the overhead of Bound.__gt__ and Bound.__lt__
+	#  an open lower bound is after, and an open upper bound is before, a closed bound with the same value.
+	if math.isclose(a_lower_value, b_lower_value):
+		lower_bound = b_lower_bound if (b_lower_bound.part_of_left and a_lower_bound.part_of_right) else a_lower_bound
+	else:
+		lower_bound = b_lower_bound if b_lower_value > a_lower_value else a_lower_bound
+	if math.isclose(a_upper_value, b_upper_value):
+		upper_bound = b_upper_bound if (b_upper_bound.part_of_right and a_upper_bound.part_of_left) else a_upper_bound
+	else:
+		upper_bound = b_upper_bound if b_upper_value < a_upper_value else a_upper_bound
 	
-	return tuple()
+	return lower_bound, upper_bound, not upper_bound_precedes_lower_bound(upper_bound, lower_bound)
 
 
 def intersects(a: Collection[Interval], b: Collection[Interval]) -> bool:
@@ -337,14 +347,21 @@ def intersects(a: Collection[Interval], b: Collection[Interval]) -> bool:
 
 
 def intersects_atomic(a: Interval, b: Interval) -> bool:
-	return (
-		contains_lower_bound_atomic(a, b.lower_bound) or
-		contains_upper_bound_atomic(a, b.upper_bound) or
-		contains_lower_bound_atomic(b, a.lower_bound) or
-		contains_upper_bound_atomic(b, a.upper_bound)
+	# a and b intersect unless one of them ends before the other starts.
+	return not (
+		upper_bound_precedes_lower_bound(a.upper_bound, b.lower_bound) or
+		upper_bound_precedes_lower_bound(b.upper_bound, a.lower_bound)
 	)
 
 
+def upper_bound_precedes_lower_bound(upper_bound: Bound, lower_bound: Bound) -> bool:
+	"""True if an interval ending at upper_bound lies entirely to the left of an interval starting at lower_bound"""
+	if math.isclose(upper_bound.value, lower_bound.value):
+		# the bounds only share a value if both are closed
+		return not (upper_bound.part_of_left and lower_bound.part_of_right)
+	return upper_bound.value < lower_bound.value
+
+
 def touches(a: Collection[Interval], b: Collection[Interval]):
 	if intersects(a, b):
 		return False
@@ -352,9 +369,10 @@ def touches(a: Collection[Interval], b: Collection[Interval]):
 
 
 def touches_atomic(a: Interval, b: Interval) -> bool:
-	if math.isclose(a.lower_bound.value, b.upper_bound.value) and (a.lower_bound.part_of_right == b.upper_bound.part_of_right):
+	a_lower_bound, a_upper_bound, b_lower_bound, b_upper_bound = a.lower_bound, a.upper_bound, b.lower_bound, b.upper_bound
+	if math.isclose(a_lower_bound.value, b_upper_bound.value) and (a_lower_bound.part_of_right == b_upper_bound.part_of_right):
 		return True
-	if math.isclose(a.upper_bound.value, b.lower_bound.value) and (a.upper_bound.part_of_left == b.lower_bound.part_of_left):
+	if math.isclose(a_upper_bound.value, b_lower_bound.value) and (a_upper_bound.part_of_left == b_lower_bound.part_of_left):
 		return True
 	return False
 
@@ -397,6 +415,39 @@ def contains_value_atomic(a: Interval, value: float) -> bool:
 	return False
 
 
+def get_sorted_index(a: Iterable[Interval]) -> Tuple[List[Interval], List[float], List[float]]:
+	"""
+	Returns the sub-intervals of a sorted by lower bound value, along with two lists which allow them to be searched using bisect;
+	(
+		sorted_intervals: List[Interval],
+		lower_bound_values: List[float],  # the lower bound value of each interval in sorted_intervals
+		max_upper_bound_values: List[float]  # the largest upper bound value of each interval in sorted_intervals and all intervals before it
+	)
+	"""
+	sorted_intervals = sorted(a, key=lambda a_interval: a_interval.lower_bound.value)
+	lower_bound_values = [a_interval.lower_bound.value for a_interval in sorted_intervals]
+	max_upper_bound_values = list(itertools.accumulate((a_interval.upper_bound.value for a_interval in sorted_intervals), max))
+	return sorted_intervals, lower_bound_values, max_upper_bound_values
+
+
+def contains_value_using_sorted_index(sorted_index: Tuple[List[Interval], List[float], List[float]], value: float) -> bool:
+	"""same as contains_value() but only tests the intervals which may contain value. sorted_index is obtained from get_sorted_index()"""
+	sorted_intervals, lower_bound_values, max_upper_bound_values = sorted_index
+	
+	# intervals with a lower bound greater than, but close to, value may still contain it.
+	end = bisect.bisect_right(lower_bound_values, value)
+	while end < len(lower_bound_values) and math.isclose(lower_bound_values[end], value):
+		end += 1
+	
+	for index in range(end - 1, -1, -1):
+		if max_upper_bound_values[index] < value and not math.isclose(max_upper_bound_values[index], value):
+			# no interval at or before this index reaches value
+			return False
+		if contains_value_atomic(sorted_intervals[index], value):
+			return True
+	return False
+
+
 def contains_interval(a: Collection[Interval], b: Collection[Interval]) -> bool:
 	return all(
 		any(contains_interval_atomic(a_interval, b_interval) for a_interval in a) for b_interval in b
@@ -411,29 +462,29 @@ def contains_interval_atomic(a: Interval, b: Interval) -> bool:
 
 
 def contains_upper_bound_atomic(a: Interval, upper_bound: Bound) -> bool:
-	if is_degenerate_atomic(a) and math.isclose(a.lower_bound.value, upper_bound.value):
-		return upper_bound.part_of_left
-	else:
-		if math.isclose(a.lower_bound.value, upper_bound.value):
-			return a.lower_bound.part_of_right and upper_bound.part_of_left
-		if math.isclose(a.upper_bound.value, upper_bound.value):
-			return not (a.upper_bound.part_of_right and upper_bound.part_of_left)
-		elif a.lower_bound < upper_bound < a.upper_bound:
-			return True
-	return False
+	a_lower_bound, a_upper_bound = a.lower_bound, a.upper_bound
+	a_lower_value, a_upper_value, value = a_lower_bound.value, a_upper_bound.value, upper_bound.value
+	if math.isclose(a_lower_value, value):
+		if a_lower_value == a_upper_value:  # a is degenerate
+			return upper_bound.part_of_left
+		return a_lower_bound.part_of_right and upper_bound.part_of_left
+	if math.isclose(a_upper_value, value):
+		return not (a_upper_bound.part_of_right and upper_bound.part_of_left)
+	# the value is not close to either bound of a, so the direction of the bounds does not matter
+	return a_lower_value < value < a_upper_value
 
 
 def contains_lower_bound_atomic(a: Interval, lower_bound: Bound) -> bool:
-	if is_degenerate_atomic(a) and math.isclose(a.upper_bound.value, lower_bound.value):
-		return lower_bound.part_of_right
-	else:
-		if math.isclose(a.lower_bound.value, lower_bound.value):
-			return not (a.lower_bound.part_of_left and lower_bound.part_of_right)
-		if math.isclose(a.upper_bound.value, lower_bound.value):
-			return a.upper_bound.part_of_left and lower_bound.part_of_right
-		if a.lower_bound < lower_bound < a.upper_bound:
-			return True
-	return False
+	a_lower_bound, a_upper_bound = a.lower_bound, a.upper_bound
+	a_lower_value, a_upper_value, value = a_lower_bound.value, a_upper_bound.value, lower_bound.value
+	if math.isclose(a_lower_value, value):
+		if a_lower_value == a_upper_value:  # a is degenerate
+			return lower_bound.part_of_right
+		return not (a_lower_bound.part_of_left and lower_bound.part_of_right)
+	if math.isclose(a_upper_value, value):
+		return a_upper_bound.part_of_left and lower_bound.part_of_right
+	# the value is not close to either bound of a, so the direction of the bounds does not matter
+	return a_lower_value < value < a_upper_value
 
 
 def left_exterior_atomic(a: Interval) -> Collection[Interval]:
@@ -458,7 +509,7 @@ def exterior_atomic(a: Interval) -> Collection[Interval]:
 
 def exterior(a: Collection[Interval]) -> Collection[Interval]:
 	from .Interval import Interval
-	return coerce_collection_to_Interval_or_Multi_Interval([
+	return coerce_new_list_to_Interval_or_Multi_Interval([
 		Interval(lower_bound, upper_bound)
 		for lower_bound, upper_bound, is_interior
 		in iter_bound_pairs(a)
@@ -486,15 +537,14 @@ def interior_merged(self) -> Collection[Interval]:
 
 
 def hull(a: Iterable[Interval]) -> Collection[Interval]:
-	result = tuple()
-	first = True
-	for a_interval in a:
-		if first:
-			result = a_interval
-			first = False
-		else:
-			result = hull_atomic(result, a_interval)
-	return result
+	intervals = list(a)
+	if len(intervals) == 0:
+		return tuple()
+	if len(intervals) == 1:
+		return intervals[0]
+	# taking min() and max() over all bounds avoids constructing an intermediate interval for each item, as repeated calls to hull_atomic would.
+	from .Interval import Interval
+	return Interval(min(a_interval.lower_bound for a_interval in intervals), max(a_interval.upper_bound for a_interval in intervals))
 	
 
 def hull_atomic(a: Interval, b: Interval) -> Interval:
@@ -506,6 +556,16 @@ def hull_atomic(a: Interval, b: Interval) -> Interval:
 # LINE SWEEP FUNCTIONS:
 #############################################
 
+def sort_bounds(bounds: Iterable[Bound]) -> List[Bound]:
+	"""
+	Sorts Bounds or Linked_Bounds using their own ordering.
+	The bounds are first sorted by value, which only compares floats. After that, the comparison methods of the bound classes
+	only need to settle the order of bounds with close values, and the final sort needs roughly one comparison per bound
+	instead of O(n log n) comparisons.
+	"""
+	return sorted(sorted(bounds, key=lambda bound: bound.value))
+
+
 def get_sorted_linked_bounds_with_stack_height(a: Collection[Interval]) -> Generator[Tuple[int, Linked_Bound, int], None, None]:
 	"""
 	Returns a generator yielding tuples;
@@ -516,7 +576,7 @@ def get_sorted_linked_bounds_with_stack_height(a: Collection[Interval]) -> Gener
 	)
 	"""
 	# TODO: remove dependence on linked bounds class?
-	sorted_linked_bounds = sorted(itertools.chain.from_iterable(get_linked_bounds(a_interval) for a_interval in a))
+	sorted_linked_bounds = sort_bounds(itertools.chain.from_iterable(get_linked_bounds(a_interval) for a_interval in a))
 	stack_count_before = 0
 	stack_count_after = 0
 	for previous_bound, current_bound, next_bound in util.iter_previous_current_next(sorted_linked_bounds):
@@ -576,6 +636,15 @@ def coerce_collection_to_Interval_or_Multi_Interval(a: Collection[Interval]) ->
 			return Multi_Interval(a)
 
 
+def coerce_new_list_to_Interval_or_Multi_Interval(a: List[Interval]) -> Union[Interval, Multi_Interval]:
+	"""like coerce_collection_to_Interval_or_Multi_Interval() but for a list built by the caller, which is wrapped without being copied"""
+	if len(a) == 1:
+		return a[0]
+	else:
+		from .Multi_Interval import Multi_Interval
+		return Multi_Interval._from_trusted_list(a)
+
+
 def coerce_collection_to_Interval_or_None(a: Collection[Interval]) -> Optional[Interval]:
 	if len(a) == 1:
 		from .Interval import Interval
@@ -589,14 +658,13 @@ def eq_atomic(a: Interval, b: Interval):
 
 
 def eq(a: Collection[Interval], b: Collection[Interval]) -> bool:
-	b_intervals = list(b)
 	if len(a) == len(b):
+		# intervals are immutable, so only the list of unmatched references needs to be copied (once) and shrunk in place
+		b_intervals = list(b)
 		try:
 			for a_interval in a:
 				index_of_first_atomic_match = next(index for index, b_interval in enumerate(b_intervals) if eq_atomic(a_interval, b_interval))
-				b_intervals = b_intervals[:index_of_first_atomic_match] + b_intervals[index_of_first_atomic_match+1:]
-		except ValueError:
-			return False
+				del b_intervals[index_of_first_atomic_match]
 		except StopIteration:
 			return False
 	else:
@@ -657,14 +725,17 @@ def union_merge_on_predicate(a: Iterable[Interval], b: Iterable[Interval], predi
 	"""
 	results = list(a)
 	for item_to_insert in b:
-		index = 0
-		while index < len(results):
-			result = results[index]
+		results_to_check = deque(results)
+		results = []
+		while results_to_check:
+			result = results_to_check.popleft()
 			if predicate(result, item_to_insert):
 				item_to_insert = hull_atomic(item_to_insert, result)
-				results.remove(result)
-				index = 0
-			index += 1
+				# item_to_insert has grown; results which were already kept must be checked against it again.
+				results_to_check.extend(results)
+				results = []
+			else:
+				results.append(result)
 		results.append(item_to_insert)
 	return results
 
@@ -684,13 +755,16 @@ def union_merge_on_predicate_linked(a: Iterable[Linked_Interval], b: Iterable[Li
 	"""
 	results = list(a)
 	for item_to_insert in b:
-		index = 0
-		while index < len(results):
-			result = results[index]
+		results_to_check = deque(results)
+		results = []
+		while results_to_check:
+			result = results_to_check.popleft()
 			if predicate(result, item_to_insert):
 				item_to_insert = hull_atomic(item_to_insert, result).link_merge([*item_to_insert.linked_objects, *result.linked_objects])
-				results.remove(result)
-				index = 0
-			index += 1
+				# item_to_insert has grown; results which were already kept must be checked against it again.
+				results_to_check.extend(results)
+				results = []
+			else:
+				results.append(result)
 		results.append(item_to_insert)
 	return results
\ No newline at end of file
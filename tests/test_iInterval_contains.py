@@ -2,6 +2,7 @@ import pytest
 
 from NicksIntervals.Bound import Bound, PART_OF_LEFT, PART_OF_RIGHT
 from NicksIntervals.Interval import Interval
+from NicksIntervals.Multi_Interval import Multi_Interval
 import NicksIntervals._operators as ops
 
 
@@ -22,6 +23,19 @@ def test_iInterval_contains_value():
 	assert a.contains_value(3.0) is False
 
 
+def test_iMulti_iInterval_contains_value():
+	a = Multi_Interval([Interval.open(5.0, 6.0), Interval.closed(0.0, 10.0), Interval.closed_open(20.0, 30.0), Interval.degenerate(15.0)])
+	assert a.contains_value(-1.0) is False
+	assert a.contains_value(0.0) is True
+	assert a.contains_value(5.0) is True
+	assert a.contains_value(10.0) is True
+	assert a.contains_value(12.0) is False
+	assert a.contains_value(15.0) is True
+	assert a.contains_value(20.0) is True
+	assert a.contains_value(30.0) is False
+	assert Multi_Interval([]).contains_value(0.0) is False
+
+
 def test_iInterval_contains_bound():
 	
 	# See ponderings.md in /docs for graphical representation of Truth Table
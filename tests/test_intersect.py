@@ -0,0 +1,19 @@
+from NicksIntervals.Interval import Interval
+from NicksIntervals.Multi_Interval import Multi_Interval
+
+
+def test_intersect():
+	a = Interval.closed(0, 10)
+	assert a.intersect(Interval.closed(5, 15)) == Interval.closed(5, 10)
+	assert a.intersect(Interval.open(2, 8)) == Interval.open(2, 8)
+	assert Interval.open(2, 8).intersect(a) == Interval.open(2, 8)
+	assert a.intersect(Interval.open_closed(10, 15)) == Interval.empty()
+	assert a.intersect(Interval.closed(10, 15)) == Interval.degenerate(10)
+	assert a.intersect(Interval.inf()) == a
+
+
+def test_intersect_multi_interval():
+	# test intersection with a multi interval preserves structure
+	a = Multi_Interval([Interval.closed(0, 20), Interval.closed(0, 20), Interval.closed(30, 40)])
+	assert a.intersect(Interval.open(10, 35)) == Multi_Interval([Interval.open_closed(10, 20), Interval.open_closed(10, 20), Interval.closed_open(30, 35)])
+	assert Interval.open(10, 35).intersect(Multi_Interval([Interval.closed(0, 20), Interval.closed(30, 40)])) == Multi_Interval([Interval.open_closed(10, 20), Interval.closed_open(30, 35)])
@@ -0,0 +1,19 @@
+from NicksIntervals.Interval import Interval
+from NicksIntervals.Multi_Interval import Multi_Interval
+
+
+def test_merge_intersecting():
+	# the first interval in the result must also be re-tested after a merge
+	a = Multi_Interval([Interval.closed(11, 13), Interval.open(12, 17), Interval.closed(12, 14)])
+	assert a.merge_intersecting() == Interval.closed_open(11, 17)
+	
+	a = Multi_Interval([Interval.closed(0, 5), Interval.closed(10, 15), Interval.closed(4, 11)])
+	assert a.merge_intersecting() == Interval.closed(0, 15)
+	
+	a = Multi_Interval([Interval.closed(0, 5), Interval.open(5, 10)])
+	assert a.merge_intersecting() == a
+
+
+def test_merge_intersecting_or_touching():
+	a = Multi_Interval([Interval.closed(0, 5), Interval.open(5, 10), Interval.closed(20, 30)])
+	assert a.merge_intersecting_or_touching() == Multi_Interval([Interval.closed_open(0, 10), Interval.closed(20, 30)])
@@ -1,21 +1,25 @@
 from collections import deque
 from itertools import chain
-from itertools import islice
 from itertools import tee
-from typing import Any, TypeVar, Union, Optional, Callable, Iterable, Iterator, Tuple
+from typing import TypeVar, Union, Optional, Callable, Iterable, Iterator, Tuple
 import collections.abc
 
 T = TypeVar("T")
 K = TypeVar("K")
 
+# marks the end of an iterator; unlike none_value it can never be an item of the iterable
+_END_OF_ITERATOR = object()
+
 
-# credit to nosklo https://stackoverflow.com/questions/1011938/python-loop-that-also-accesses-previous-and-next-values
 def iter_previous_current_next(some_iterable: Iterable[T], none_value: Optional[K] = None) -> Iterator[Tuple[Union[Optional[K], T], T, Union[Optional[K], T]]]:
 	"""[1,2,3,4,5] -> ( (None,1,2), (1,2,3), (2,3,4), (3,4,5), (4,5,None) )"""
-	previous_items, current_items, next_items = tee(some_iterable, 3)
-	previous_items = chain([none_value], previous_items)
-	next_items = chain(islice(next_items, 1, None), [none_value])
-	return zip(previous_items, current_items, next_items)
+	iterator = iter(some_iterable)
+	previous_item = none_value
+	current_item = next(iterator, _END_OF_ITERATOR)
+	while current_item is not _END_OF_ITERATOR:
+		next_item = next(iterator, _END_OF_ITERATOR)
+		yield previous_item, current_item, none_value if next_item is _END_OF_ITERATOR else next_item
+		previous_item, current_item = current_item, next_item
 
 
 def iter_previous_current(some_iterable: Iterable[T], none_value: Optional[K] = None) -> Iterator[Tuple[Union[Optional[K], T], T]]:
@@ -97,12 +101,14 @@ def iter_yield_duplicate_pairs(iterable: Iterable[T]) -> Iterable[Tuple[T, T]]:
 	return ((item, item) for item in iterable)
 
 
-def first_and_last(iterable: Iterator) -> Tuple[Any, Any]:
-	is_first = True
-	last_item = None
-	for item in iterable:
-		if is_first:
-			is_first = False
-			yield item
-		last_item = item
-	yield last_item
\ No newline at end of file
+def first_and_last(iterable: Iterable[T]) -> Optional[Tuple[T, T]]:
+	"""[1,2,3,4,5] -> (1, 5); [1] -> (1, 1); [] -> None
+	Consumes the iterable once."""
+	iterator = iter(iterable)
+	first_item = next(iterator, _END_OF_ITERATOR)
+	if first_item is _END_OF_ITERATOR:
+		return None
+	last_item = first_item
+	for last_item in iterator:
+		pass
+	return first_item, last_item
\ No newline at end of file